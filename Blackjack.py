@@ -2,6 +2,7 @@ import pygame
 import sys
 import random
 import math
+from collections import OrderedDict
 from typing import List, Optional, Tuple
 from enum import Enum
 
@@ -16,6 +17,10 @@ CARD_HEIGHT = 140
 BUTTON_WIDTH = 200
 BUTTON_HEIGHT = 50
 FPS = 60
+TEXT_CACHE_SIZE = 64
+IDLE_WAIT_MS = 100
+SETTLE_EPSILON = 0.5
+DEALER_DELAY_MS = 500
 
 # Colors
 BLACK = (0, 0, 0)
@@ -29,6 +34,11 @@ GOLD = (255, 215, 0)
 FONT = pygame.font.Font(None, 36)
 CARD_FONT = pygame.font.Font(None, 50)
 
+# Card faces never change, so each (suit, rank) is rendered once and shared
+_IMAGE_CACHE: dict = {}
+# Rotated card faces, keyed by (suit, rank, whole-degree angle)
+_ROTATED_CACHE: dict = {}
+
 class Suit(Enum):
     HEARTS = "H"
     DIAMONDS = "D"
@@ -54,13 +64,28 @@ class Card:
     def __init__(self, suit: Suit, rank: Rank):
         self.suit = suit
         self.rank = rank
+        self.value = min(rank.value, 10)
+        self.is_ace = rank is Rank.ACE
         self.image = self.load_image()
-        self.pos = (0, 0)
-        self.target_pos = (0, 0)
+        self.x = 0.0
+        self.y = 0.0
+        self.tx = 0.0
+        self.ty = 0.0
         self.angle = 0
         self.target_angle = 0
+        self.settled = True
+        # Blit arguments for a settled card, which no longer moves
+        self._settled_blit = None
 
     def load_image(self) -> pygame.Surface:
+        key = (self.suit, self.rank)
+        image = _IMAGE_CACHE.get(key)
+        if image is None:
+            image = self._render_image()
+            _IMAGE_CACHE[key] = image
+        return image
+
+    def _render_image(self) -> pygame.Surface:
         surface = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
         surface.fill(WHITE)
         pygame.draw.rect(surface, BLACK, surface.get_rect(), 2)
@@ -77,19 +102,57 @@ class Card:
         return surface
 
     def get_value(self) -> int:
-        return min(self.rank.value, 10)
+        return self.value
 
     def update(self):
+        if self.settled:
+            return
         # Smoothly move the card to its target position
-        self.pos = (self.pos[0] * 0.9 + self.target_pos[0] * 0.1,
-                    self.pos[1] * 0.9 + self.target_pos[1] * 0.1)
+        self.x = self.x * 0.9 + self.tx * 0.1
+        self.y = self.y * 0.9 + self.ty * 0.1
         # Smoothly rotate the card to its target angle
         self.angle = self.angle * 0.9 + self.target_angle * 0.1
 
-    def draw(self, screen):
-        rotated_image = pygame.transform.rotate(self.image, self.angle)
-        new_rect = rotated_image.get_rect(center=self.image.get_rect(topleft=self.pos).center)
-        screen.blit(rotated_image, new_rect.topleft)
+        if (abs(self.x - self.tx) < SETTLE_EPSILON
+                and abs(self.y - self.ty) < SETTLE_EPSILON
+                and abs(self.angle - self.target_angle) < SETTLE_EPSILON):
+            self.x = self.tx
+            self.y = self.ty
+            self.angle = self.target_angle
+            self.settled = True
+            self._settled_blit = None
+
+    def blit_args(self) -> Tuple[pygame.Surface, Tuple[float, float]]:
+        if self.settled:
+            if self._settled_blit is None:
+                self._settled_blit = self._compute_blit_args()
+            return self._settled_blit
+        return self._compute_blit_args()
+
+    def _compute_blit_args(self) -> Tuple[pygame.Surface, Tuple[float, float]]:
+        # Too small a tilt to see, so skip rotating altogether
+        if abs(self.angle) < 0.5:
+            return self.image, (self.x, self.y)
+        angle = round(self.angle)
+        key = (self.suit, self.rank, angle)
+        rotated_image = _ROTATED_CACHE.get(key)
+        if rotated_image is None:
+            rotated_image = pygame.transform.rotate(self.image, angle)
+            _ROTATED_CACHE[key] = rotated_image
+        new_rect = rotated_image.get_rect(center=self.image.get_rect(topleft=(self.x, self.y)).center)
+        return rotated_image, new_rect.topleft
+
+# Every card in a deck, built once by preload_images() and shared by all rounds
+_ALL_CARDS: Tuple[Card, ...] = ()
+
+def preload_images() -> None:
+    # convert() needs a display, so this runs once set_mode has been called
+    global _ALL_CARDS
+    cards = [Card(suit, rank) for suit in Suit for rank in Rank]
+    for card in cards:
+        card.image = card.image.convert()
+        _IMAGE_CACHE[(card.suit, card.rank)] = card.image
+    _ALL_CARDS = tuple(cards)
 
 class Deck:
     def __init__(self):
@@ -97,7 +160,13 @@ class Deck:
         self.build()
 
     def build(self) -> None:
-        self.cards = [Card(suit, rank) for suit in Suit for rank in Rank]
+        if not _ALL_CARDS:
+            raise RuntimeError("preload_images() must be called before building a Deck")
+        self.cards = list(_ALL_CARDS)
+
+    def reset(self) -> None:
+        # Cards are shared between rounds; give_card() resets their animation state
+        self.build()
 
     def shuffle(self) -> None:
         random.shuffle(self.cards)
@@ -105,22 +174,38 @@ class Deck:
     def deal(self) -> Optional[Card]:
         return self.cards.pop() if self.cards else None
 
+    def deal_many(self, count: int) -> List[Card]:
+        # Same order as calling deal() count times, with a single slice delete
+        if count <= 0:
+            return []
+        cards = self.cards[-count:][::-1]
+        del self.cards[-count:]
+        return cards
+
 class Player:
     def __init__(self, name: str, is_dealer: bool = False):
         self.name = name
         self.hand: List[Card] = []
         self.is_dealer = is_dealer
         self.chips = 1000 if not is_dealer else 0
+        # Running totals so the hand value doesn't need to walk the hand
+        self._base_value = 0
+        self._aces = 0
 
     def add_card(self, card: Card) -> None:
         self.hand.append(card)
+        self._base_value += card.value
+        if card.is_ace:
+            self._aces += 1
 
     def clear_hand(self) -> None:
         self.hand.clear()
+        self._base_value = 0
+        self._aces = 0
 
     def get_hand_value(self) -> int:
-        value = sum(card.get_value() for card in self.hand)
-        num_aces = sum(1 for card in self.hand if card.rank == Rank.ACE)
+        value = self._base_value
+        num_aces = self._aces
 
         while value > 21 and num_aces:
             value -= 10
@@ -134,14 +219,18 @@ class Button:
         self.text = text
         self.color = color
         self.hover = False
-
-    def draw(self, surface: pygame.Surface) -> None:
-        color = [min(c + 20, 255) if self.hover else c for c in self.color]
+        # Colors and label never change, so work them out up front
+        self._normal_color = tuple(color)
+        self._hover_color = tuple(min(c + 20, 255) for c in color)
+        self._text_surface = FONT.render(self.text, True, WHITE)
+        self._text_rect = self._text_surface.get_rect(center=self.rect.center)
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        color = self._hover_color if self.hover else self._normal_color
         pygame.draw.rect(surface, color, self.rect, border_radius=10)
         pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=10)
-        text_surface = FONT.render(self.text, True, WHITE)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        surface.blit(self._text_surface, self._text_rect)
+        return self.rect
 
     def is_clicked(self, pos: Tuple[int, int]) -> bool:
         return self.rect.collidepoint(pos)
@@ -151,9 +240,17 @@ class Button:
 
 class BlackjackGame:
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Frame pacing is left to clock.tick alone. vsync needs the SCALED or
+        # OPENGL renderer, which would throw away the dirty-rect updates in draw()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), vsync=0)
         pygame.display.set_caption("Blackjack")
         self.clock = pygame.time.Clock()
+        preload_images()
+
+        # Only queue the events we handle; hover reads the mouse directly
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN,
+                                  pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
 
         self.deck = Deck()
         self.player = Player("Player")
@@ -166,6 +263,15 @@ class BlackjackGame:
 
         self.game_state = "betting"
         self.message = "Enter bet amount:"
+        self._next_dealer_action_time = 0
+
+        # Rendered text surfaces with their half sizes for centering, keyed by
+        # string and evicted least-recently-used
+        self._text_cache: "OrderedDict[str, Tuple[pygame.Surface, int, int]]" = OrderedDict()
+
+        # Screen areas drawn this frame and last frame, so only those get pushed
+        self._dirty: List[pygame.Rect] = []
+        self._prev_dirty: List[pygame.Rect] = [self.screen.get_rect()]
 
         # Background
         self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -174,19 +280,42 @@ class BlackjackGame:
             start_pos = (random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT))
             end_pos = (random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT))
             pygame.draw.line(self.background, (0, 80, 0), start_pos, end_pos, 2)
+        self.background = self.background.convert()
 
     def run(self) -> None:
         while True:
-            self.handle_events()
+            timeout = self.idle_timeout()
+            if timeout:
+                # Nothing is moving, so block on input until the next frame is due
+                events = [pygame.event.wait(timeout)] + pygame.event.get()
+            else:
+                events = pygame.event.get()
+                self.clock.tick(FPS)
+            self.handle_events(events)
             self.update()
             self.draw()
-            self.clock.tick(FPS)
 
-    def handle_events(self) -> None:
-        for event in pygame.event.get():
+    def cards_settled(self) -> bool:
+        return all(card.settled for card in self.player.hand + self.dealer.hand)
+
+    def idle_timeout(self) -> int:
+        # How long run() may wait for input, or 0 if a frame is due now
+        if not self.cards_settled():
+            return 0
+        if self.game_state in ("betting", "game_over"):
+            return IDLE_WAIT_MS
+        if self.game_state == "dealer_turn":
+            return max(0, self._next_dealer_action_time - pygame.time.get_ticks())
+        return 0
+
+    def handle_events(self, events: List[pygame.event.Event]) -> None:
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window was uncovered, so repaint all of it next frame
+                self._prev_dirty.append(self.screen.get_rect())
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse button
                     self.handle_click(event.pos)
@@ -213,62 +342,81 @@ class BlackjackGame:
             self.message += event.unicode
 
     def update(self) -> None:
-        mouse_pos = pygame.mouse.get_pos()
-        self.hit_button.update(mouse_pos)
-        self.stand_button.update(mouse_pos)
-        self.deal_button.update(mouse_pos)
-
         if self.game_state == "dealing":
             self.deal_initial_cards()
         elif self.game_state == "dealer_turn":
             self.dealer_turn()
 
+        # Only the buttons drawn in the current state need their hover updated,
+        # checked after any state change so a newly shown button starts correct
+        if self.game_state == "player_turn":
+            mouse_pos = pygame.mouse.get_pos()
+            self.hit_button.update(mouse_pos)
+            self.stand_button.update(mouse_pos)
+        elif self.game_state == "game_over":
+            self.deal_button.update(pygame.mouse.get_pos())
+
         for player in [self.player, self.dealer]:
-            for i, card in enumerate(player.hand):
-                if player.is_dealer:
-                    card.target_pos = (50 + i * 30, 50)
-                else:
-                    card.target_pos = (50 + i * 30, SCREEN_HEIGHT - 250)
-                card.target_angle = random.uniform(-5, 5)
+            for card in player.hand:
                 card.update()
 
     def draw(self) -> None:
-        self.screen.blit(self.background, (0, 0))
-        
+        # Erase whatever was drawn last frame; everything is redrawn below
+        for rect in self._prev_dirty:
+            self.screen.blit(self.background, rect, rect)
+
         # Draw hands
         self.draw_hand(self.player.hand)
-        self.draw_hand(self.dealer.hand, self.game_state != "dealer_turn")
+        self.draw_hand(self.dealer.hand, self.game_state not in ("dealer_turn", "game_over"))
 
-        # Draw buttons
+        # Draw buttons, grouped into a single dirty rect
         if self.game_state == "player_turn":
-            self.hit_button.draw(self.screen)
-            self.stand_button.draw(self.screen)
+            self._dirty.append(self.hit_button.draw(self.screen).union(self.stand_button.draw(self.screen)))
         elif self.game_state == "game_over":
-            self.deal_button.draw(self.screen)
+            self._dirty.append(self.deal_button.draw(self.screen))
 
         # Draw messages
         self.draw_text(f"Player Chips: {self.player.chips}", 110, 10)
         self.draw_text(f"Current Bet: {self.bet}", 83, 40)
         self.draw_text(self.message, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
 
-        pygame.display.flip()
+        pygame.display.update(self._prev_dirty + self._dirty)
+        self._prev_dirty = self._dirty
+        self._dirty = []
 
     def draw_hand(self, hand: List[Card], hide_first: bool = False) -> None:
+        rects = []
+        blit_list = []
         for i, card in enumerate(hand):
             if i == 0 and hide_first:
                 # Draw card back
-                pygame.draw.rect(self.screen, BLUE, (*card.pos, CARD_WIDTH, CARD_HEIGHT), border_radius=5)
-                pygame.draw.rect(self.screen, GOLD, (*card.pos, CARD_WIDTH, CARD_HEIGHT), 2, border_radius=5)
+                rects.append(pygame.draw.rect(self.screen, BLUE, (card.x, card.y, CARD_WIDTH, CARD_HEIGHT), border_radius=5))
+                pygame.draw.rect(self.screen, GOLD, (card.x, card.y, CARD_WIDTH, CARD_HEIGHT), 2, border_radius=5)
             else:
-                card.draw(self.screen)
+                blit_list.append(card.blit_args())
+        # The face-down card is always first, so batching the rest keeps draw order
+        if blit_list:
+            rects.extend(self.screen.blits(blit_list))
+        # One rect for the whole hand rather than one per card
+        if rects:
+            self._dirty.append(rects[0].unionall(rects[1:]))
 
     def draw_text(self, text: str, x: int, y: int) -> None:
-        text_surface = FONT.render(text, True, WHITE)
-        text_rect = text_surface.get_rect(center=(x, y))
-        self.screen.blit(text_surface, text_rect)
+        entry = self._text_cache.get(text)
+        if entry is None:
+            text_surface = FONT.render(text, True, WHITE).convert_alpha()
+            width, height = text_surface.get_size()
+            entry = (text_surface, width // 2, height // 2)
+            self._text_cache[text] = entry
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(text)
+        text_surface, half_w, half_h = entry
+        self._dirty.append(self.screen.blit(text_surface, (x - half_w, y - half_h)))
 
     def start_new_round(self) -> None:
-        self.deck = Deck()
+        self.deck.reset()
         self.deck.shuffle()
         self.player.clear_hand()
         self.dealer.clear_hand()
@@ -289,17 +437,28 @@ class BlackjackGame:
             self.message = "Invalid input. Enter bet amount:"
 
     def deal_initial_cards(self) -> None:
-        for _ in range(2):
-            self.deal_card(self.player)
-            self.deal_card(self.dealer)
+        # Alternate player and dealer, two cards each
+        for i, card in enumerate(self.deck.deal_many(4)):
+            self.give_card(self.dealer if i % 2 else self.player, card)
         self.game_state = "player_turn"
         self.message = "Your turn: Hit or Stand?"
 
     def deal_card(self, player: Player) -> None:
         card = self.deck.deal()
         if card:
-            card.pos = (SCREEN_WIDTH // 2, 0)  # Start from the top center
-            player.add_card(card)
+            self.give_card(player, card)
+
+    def give_card(self, player: Player, card: Card) -> None:
+        card.x, card.y = SCREEN_WIDTH // 2, 0  # Start from the top center
+        card.angle = 0
+        i = len(player.hand)
+        if player.is_dealer:
+            card.tx, card.ty = 50 + i * 30, 50
+        else:
+            card.tx, card.ty = 50 + i * 30, SCREEN_HEIGHT - 250
+        card.target_angle = random.uniform(-5, 5)
+        card.settled = False
+        player.add_card(card)
 
     def player_hit(self) -> None:
         self.deal_card(self.player)
@@ -315,8 +474,12 @@ class BlackjackGame:
         self.message = "Dealer's turn..."
 
     def dealer_turn(self) -> None:
+        now = pygame.time.get_ticks()
+        if now < self._next_dealer_action_time:
+            return
         if self.dealer.get_hand_value() < 17:
             self.deal_card(self.dealer)
+            self._next_dealer_action_time = now + DEALER_DELAY_MS
         else:
             self.determine_winner()
 